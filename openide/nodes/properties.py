@@ -12,7 +12,8 @@ from collections.abc import Generator
 from copy import copy
 from typing import (
     FrozenSet, Generic, Optional,
-    MutableMapping, Any, Type, TypeVar, Set,
+    Any, Type, TypeVar,
+    Callable, ClassVar,
 )
 from weakref import ReferenceType
 
@@ -23,6 +24,9 @@ from weakref import ReferenceType
 VT = TypeVar('VT')
 ET = TypeVar('ET')
 
+# Shared by all FeatureDescriptor without dynamic attribute values. Must never be mutated.
+_EMPTY_VALUES: dict[str, Any] = {}
+
 
 class FeatureDescriptor:
     '''
@@ -41,6 +45,31 @@ class FeatureDescriptor:
     It also provides a generic way of adding dynamic attribute values.
     '''
 
+    __slots__ = (
+        '_system_name', '_display_name',
+        '_is_expert', '_is_hidden', '_is_preferred',
+        '_short_description', '_values', '_attribute_names',
+        '_hash',
+        '__weakref__',
+    )
+
+    # __copy_super__ of the next class after FeatureDescriptor in the MRO having one, if any.
+    # Resolved once per class, in __init_subclass__.
+    _next_copy_super: ClassVar[Optional[Callable[[Any, FeatureDescriptor], None]]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        mro = cls.__mro__
+        cls._next_copy_super = next(
+            (
+                vars(base)['__copy_super__']
+                for base in mro[mro.index(FeatureDescriptor) + 1:]
+                if '__copy_super__' in vars(base)
+            ),
+            None
+        )
+
     def __init__(self) -> None:
         '''
         Initialises a FeatureDescriptor with defaults.
@@ -55,14 +84,17 @@ class FeatureDescriptor:
 
         Calls super().__init__() at the end.
         '''
-        self.__system_name: Optional[str] = None
-        self.__display_name: Optional[str] = None
-        self.__is_expert = False
-        self.__is_hidden = False
-        self.__is_preferred = False
-        self.__short_description: Optional[str] = None
+        self._system_name: Optional[str] = None
+        self._hash: Optional[int] = None  # Cached hash of system_name
+        self._display_name: Optional[str] = None
+        self._is_expert = False
+        self._is_hidden = False
+        self._is_preferred = False
+        self._short_description: Optional[str] = None
         # Lazy instanciation of dynamic attribute dict
-        self.__values: Optional[MutableMapping[str, Any]] = None
+        self._values: dict[str, Any] = _EMPTY_VALUES
+        # Cached keys of _values, None when to be recomputed
+        self._attribute_names: Optional[FrozenSet[str]] = None
 
         super().__init__()
 
@@ -95,20 +127,24 @@ class FeatureDescriptor:
 
         - new: The new object to copy members onto.
         '''
-        if hasattr(super(), '__copy_super__'):
-            super().__copy_super__(new)  # type: ignore
-
-        new.system_name = self.system_name
-        new.__display_name = self.__display_name
-        new.is_expert = self.is_expert
-        new.is_hidden = self.is_hidden
-        new.is_preferred = self.is_preferred
-        new.__short_description = self.__short_description
-
-        if self.__values:
-            if new.__values is None:
-                new.__values = dict()
-            new.__values.update(self.__values)
+        if (next_copy_super := type(self)._next_copy_super) is not None:
+            next_copy_super(self, new)
+
+        # Members are copied as-is, without going through their property setters
+        new._system_name = self._system_name
+        new._hash = self._hash
+        new._display_name = self._display_name
+        new._is_expert = self._is_expert
+        new._is_hidden = self._is_hidden
+        new._is_preferred = self._is_preferred
+        new._short_description = self._short_description
+
+        if self._values:
+            if new._values is _EMPTY_VALUES:
+                new._values = self._values.copy()
+            else:
+                new._values.update(self._values)
+            new._attribute_names = None
 
     @classmethod
     def merge(cls, first: FeatureDescriptor, second: FeatureDescriptor) -> FeatureDescriptor:
@@ -133,33 +169,31 @@ class FeatureDescriptor:
         '''
         new = copy(second)
 
-        if new.__display_name is None:
-            new.__display_name = first.__display_name
+        if new._display_name is None:
+            new._display_name = first._display_name
 
         new.is_expert = first.is_expert or second.is_expert
         new.is_hidden = first.is_hidden or second.is_hidden
         new.is_preferred = first.is_preferred or second.is_preferred
 
-        if new.__short_description is None:
-            new.__short_description = first.__short_description
-
-        if first.__values:
-                if new.__values is None:
-                    new.__values = dict()
+        if new._short_description is None:
+            new._short_description = first._short_description
 
-            for k in first.__values.keys() - new.__values.keys():
-                new.__values[k] = first.__values[k]
+        if first._values:
+            new._values = first._values | new._values
+            new._attribute_names = None
 
         return new
 
     @property
     def system_name(self) -> Optional[str]:
         '''Programmatic name for this object.'''
-        return self.__system_name
+        return self._system_name
 
     @system_name.setter
     def system_name(self, value: Optional[str]) -> None:
-        self.__system_name = value
+        self._system_name = value
+        self._hash = None
 
     @property
     def display_name(self) -> Optional[str]:
@@ -168,41 +202,43 @@ class FeatureDescriptor:
 
         If none is set, returns the system_name instead.
         '''
-        return self.__display_name if self.__display_name is not None else self.system_name
+        if (display_name := self._display_name) is not None:
+            return display_name
+        return self.system_name
 
     @display_name.setter
     def display_name(self, value: Optional[str]) -> None:
-        self.__display_name = value
+        self._display_name = value
 
     @property
     def is_expert(self) -> bool:
         '''Tells if this feature is flagged as an expert feature
         (ie. shown to end users only when an expert context is activated).'''
-        return self.__is_expert
+        return self._is_expert
 
     @is_expert.setter
     def is_expert(self, value: bool) -> None:
-        self.__is_expert = value
+        self._is_expert = value
 
     @property
     def is_hidden(self) -> bool:
         '''Tells if this feature is flagged as an hidden feature
         (ie. for programmatic access only, not shown to end users).'''
-        return self.__is_hidden
+        return self._is_hidden
 
     @is_hidden.setter
     def is_hidden(self, value: bool) -> None:
-        self.__is_hidden = value
+        self._is_hidden = value
 
     @property
     def is_preferred(self) -> bool:
         '''Tells if this feature is flagged as a preferred feature
         (ie. shown with importance (eg. highlighted, first) to end users).'''
-        return self.__is_preferred
+        return self._is_preferred
 
     @is_preferred.setter
     def is_preferred(self, value: bool) -> None:
-        self.__is_preferred = value
+        self._is_preferred = value
 
     @property
     def short_description(self) -> Optional[str]:
@@ -211,14 +247,13 @@ class FeatureDescriptor:
 
         If none is set, returns the display_name instead.
         '''
-        if self.__short_description is not None:
-            return self.__short_description
-        else:
-            return self.display_name
+        if (short_description := self._short_description) is not None:
+            return short_description
+        return self.display_name
 
     @short_description.setter
     def short_description(self, value: Optional[str]) -> None:
-        self.__short_description = value
+        self._short_description = value
 
     def get_value(self, name: str) -> Optional[Any]:
         '''
@@ -226,10 +261,7 @@ class FeatureDescriptor:
 
         If the attribute name is unknown, returns None.
         '''
-        if self.__values:
-            return self.__values.get(name, None)
-        else:
-            return None
+        return self._values.get(name, None)
 
     def set_value(self, name: str, value: Optional[Any]) -> None:
         '''
@@ -237,18 +269,22 @@ class FeatureDescriptor:
 
         Can also be set to None.
         '''
-        if self.__values is None:
-            self.__values = dict()
+        values = self._values
+        if values is _EMPTY_VALUES:
+            self._values = {name: value}
+            self._attribute_names = None
+            return
 
-        self.__values[name] = value
+        if name not in values:
+            self._attribute_names = None
+        values[name] = value
 
     @property
     def attribute_names(self) -> FrozenSet[str]:
         '''Returns set of known dynamic attribute names.'''
-        if self.__values is not None:
-            return frozenset(self.__values.keys())
-        else:
-            return frozenset()
+        if (names := self._attribute_names) is None:
+            names = self._attribute_names = frozenset(self._values)
+        return names
 
     def __str__(self) -> str:
         '''
@@ -270,17 +306,22 @@ class FeatureDescriptor:
         Subclasses should overload this method, calling "yield from super().__str_add__()"
         to get the base classes member representations, and yield their own.
         '''
-        names = 'system_name display_name is_preferred is_hidden is_expert short_description'
-        for attr_name in names.split():
-            attr_value = getattr(self, f'_FeatureDescriptor__{attr_name}')
-            attr_str = self.__str_value__(
-                attr_name, attr_value, force_value=(attr_name == 'system_name'))
-            if attr_str is not None:
-                yield attr_str
-
-        if self.__values:
+        # Same representation as __str_value__ would give, specialised per member
+        yield f'system_name={self._system_name}'
+        if (display_name := self._display_name) is not None:
+            yield f'display_name={display_name}'
+        if self._is_preferred:
+            yield 'is_preferred'
+        if self._is_hidden:
+            yield 'is_hidden'
+        if self._is_expert:
+            yield 'is_expert'
+        if (short_description := self._short_description) is not None:
+            yield f'short_description={short_description}'
+
+        if self._values:
             values_str = []
-            for name, value in self.__values.items():
+            for name, value in self._values.items():
                 value_str = self.__str_value__(name, value, force_value=True)
                 if value_str is not None:
                     values_str.append(value_str)
@@ -305,9 +346,16 @@ class FeatureDescriptor:
 
         Returns a string representation, or None if the member should not be represented.
         '''
-        if isinstance(value, ReferenceType):
+        value_type = type(value)
+        # Members are mostly None, strings or booleans, which cannot be weakrefs
+        if (
+            (value is not None) and (value_type is not str) and (value_type is not bool) and
+            isinstance(value, ReferenceType)
+        ):
             value = value()
-        if (not force_value) and isinstance(value, bool):
+            value_type = type(value)
+
+        if (not force_value) and (value_type is bool):
             if value:
                 return name
             else:
@@ -326,12 +374,16 @@ class FeatureDescriptor:
 
     def __hash__(self) -> int:
         '''Hashing protocol, based solely on system_name hash.'''
-        return hash(self.system_name)
+        if (hash_ := self._hash) is None:
+            hash_ = self._hash = hash(self.system_name)
+        return hash_
 
 
 class Property(Generic[VT], FeatureDescriptor, ABC):
     '''Provides property declaration for nodes.'''
 
+    __slots__ = ('_type', '_type_hash')
+
     def __init__(self, value_type: Type[VT]) -> None:
         '''Initialises a Property with defaults from FeatureDescriptor,
         except for system_name which is set to an empty string.
@@ -339,7 +391,9 @@ class Property(Generic[VT], FeatureDescriptor, ABC):
         - value_type: The type for this property value.
         '''
         super().__init__()
-        self.__type = value_type
+        self._type = value_type
+        # value_type cannot change afterwards, so its hash part is computed once
+        self._type_hash = hash(value_type) if value_type is not None else 1
         self.system_name = ''
 
     def __copy__(self) -> Property:
@@ -350,7 +404,7 @@ class Property(Generic[VT], FeatureDescriptor, ABC):
     @property
     def value_type(self) -> Type[VT]:
         '''The type of this property value.'''
-        return self.__type
+        return self._type
 
     @property
     @abstractmethod
@@ -397,7 +451,7 @@ class Property(Generic[VT], FeatureDescriptor, ABC):
 
     @property
     def property_editor(self) -> None:
-        if self.__type is None:
+        if self._type is None:
             return None
         raise NotImplementedError('TODO')
 
@@ -416,7 +470,7 @@ class Property(Generic[VT], FeatureDescriptor, ABC):
     def __str_add__(self) -> Generator[str, None, None]:
         yield from super().__str_add__()
 
-        value = self.__str_value__('value_type', self.value_type, force_value=True)
+        value = self.__str_value__('value_type', self._type, force_value=True)
         if value is not None:
             yield value
 
@@ -435,15 +489,14 @@ class Property(Generic[VT], FeatureDescriptor, ABC):
 
     def __eq__(self, other: Any) -> bool:
         '''Equal protocol, based on system_name, and value_type equality.'''
-        if not super().__eq__(other):
+        if not FeatureDescriptor.__eq__(self, other):
             return False
 
         try:
-            return (self.value_type == other.value_type)
+            return (self._type == other.value_type)
         except AttributeError:
             return False
 
     def __hash__(self) -> int:
         '''Hashing protocol, based on system_name, and value_type hashes.'''
-        type_hash = hash(self.value_type) if self.value_type is not None else 1
-        return super().__hash__() * type_hash
+        return FeatureDescriptor.__hash__(self) * self._type_hash
@@ -7,10 +7,11 @@
 from __future__ import annotations
 
 # System imports
+import sys
 import typing
 from abc import abstractmethod
 from collections.abc import Generator
-from functools import partial
+from functools import lru_cache, partial
 from typing import (
     TYPE_CHECKING, Any, Callable, Generic, Mapping, Optional, Protocol,
     Type, TypeVar, Union, cast, runtime_checkable,
@@ -19,7 +20,7 @@ from typing import (
 # Third-party imports
 
 # Local imports
-from openide.nodes.properties import Property, IndexedProperty, VT, ET
+from openide.nodes.properties import Property, VT
 
 
 if TYPE_CHECKING:
@@ -28,6 +29,8 @@ if TYPE_CHECKING:
 
 class PropertySupport(Property, Generic[VT]):
 
+    __slots__ = ('__can_read', '__can_write')
+
     def __init__(
         self,
         system_name: str,
@@ -42,7 +45,10 @@ class PropertySupport(Property, Generic[VT]):
 
         super().__init__(value_type)
 
-        self.system_name = system_name
+        # Interned, so that listeners comparing names against literals hit the identity fast path.
+        # Only exact str can be interned, subclasses are kept as given.
+        self.system_name = (
+            sys.intern(system_name) if type(system_name) is str else system_name)
         self.display_name = display_name
         self.short_description = short_description
         self.__can_read = can_read
@@ -73,6 +79,8 @@ class PropertySupport(Property, Generic[VT]):
 
 class ReadWriteProperty(PropertySupport[VT]):
 
+    __slots__ = ()
+
     def __init__(
         self,
         system_name: str,
@@ -89,6 +97,8 @@ class ReadWriteProperty(PropertySupport[VT]):
 
 class ReadOnlyProperty(PropertySupport[VT]):
 
+    __slots__ = ()
+
     def __init__(
         self,
         system_name: str,
@@ -115,6 +125,8 @@ class ReadOnlyProperty(PropertySupport[VT]):
 
 class WriteOnlyProperty(PropertySupport[VT]):
 
+    __slots__ = ()
+
     def __init__(
         self,
         system_name: str,
@@ -146,8 +158,48 @@ SetterProtocol: 'TypeAlias' = Callable[[VT], None]
 DVT = TypeVar('DVT')
 
 
+def _guess_get_type(getter: Callable) -> Optional[Type]:
+    return typing.get_type_hints(getter).get('return', None)
+
+
+def _guess_set_type(setter: Callable) -> Optional[Type]:
+    arg_types = [
+        arg_type
+        for name, arg_type in typing.get_type_hints(setter).items()
+        if name != 'return'
+    ]
+    return arg_types[-1] if arg_types else None
+
+
+_guess_get_type_cached = lru_cache(maxsize=1024)(_guess_get_type)
+_guess_set_type_cached = lru_cache(maxsize=1024)(_guess_set_type)
+
+
+def _guess_type(
+    guess_cached: Callable[[Callable], Optional[Type]],
+    guess: Callable[[Callable], Optional[Type]],
+    func: Callable,
+) -> Optional[Type]:
+    func = getattr(func, '__func__', func)
+    try:
+        hash(func)
+    except TypeError:
+        return guess(func)
+    return guess_cached(func)
+
+
+def _not_readable() -> Any:
+    raise AttributeError('Property is not readable')
+
+
+def _not_writable(value: Any) -> None:
+    raise AttributeError('Property is not writable')
+
+
 class GetterSetterProperty(Property[VT]):
 
+    __slots__ = ('_value_get', '_value_set')
+
     class _ValueDescriptor(Generic[DVT]):
 
         def __get__(
@@ -158,16 +210,10 @@ class GetterSetterProperty(Property[VT]):
             if obj is None:
                 raise AttributeError('Can only get on an instance')
 
-            if (get := obj._get) is None:
-                raise AttributeError('Property is not readable')
-
-            return get()
+            return obj._value_get()
 
         def __set__(self, obj: GetterSetterProperty, value: DVT) -> None:
-            if (set := obj._set) is None:
-                raise AttributeError('Property is not writable')
-
-            set(value)
+            obj._value_set(value)
 
     def __init__(
         self,
@@ -176,24 +222,26 @@ class GetterSetterProperty(Property[VT]):
         value_type: Optional[Type[VT]] = None,
         **kwargs: Any,
     ) -> None:
-        self._get = getter
-        self._set = setter
-
-        if not self._get and not self._set:
+        if not getter and not setter:
             raise ValueError('Need to specify at least one of getter or setter')
 
-        if (self._get is not None) and (not callable(self._get)):
+        if (getter is not None) and (not callable(getter)):
             raise TypeError('Provided getter is not callable')
 
-        if (self._set is not None) and (not callable(self._set)):
+        if (setter is not None) and (not callable(setter)):
             raise TypeError('Provided setter is not callable')
 
         if value_type is None:
-            value_type = self._guess_getset_type(self._get, self._set)
+            value_type = self._guess_getset_type(getter, setter)
 
         if value_type is None:
             raise ValueError('Value type is not provided, and it was not possible to guess it')
 
+        # Resolved once here, so that value access does not have to check for None each time.
+        # They are the only record of getter and setter, can_read/can_write derive from them.
+        self._value_get: GetterProtocol[VT] = getter if getter is not None else _not_readable
+        self._value_set: SetterProtocol[VT] = setter if setter is not None else _not_writable
+
         super().__init__(value_type=value_type, **kwargs)
 
     @staticmethod
@@ -201,32 +249,28 @@ class GetterSetterProperty(Property[VT]):
         getter: Optional[Callable],
         setter: Optional[Callable]
     ) -> Optional[Type]:
-        def guess_get_type(getter: Optional[Callable]) -> Optional[Type]:
-            if getter is None:
-                return None
-            type_hints = typing.get_type_hints(getter)
-            if 'return' not in type_hints:
-                return None
-            return type_hints['return']
-
-        def guess_set_type(setter: Optional[Callable]) -> Optional[Type]:
-            if setter is None:
-                return None
-            type_hints = typing.get_type_hints(setter)
-            if 'return' in type_hints:
-                del type_hints['return']
-            if not type_hints:
-                return None
-            return next(reversed(type_hints.values()))
-
-        value_type = guess_get_type(getter)
-        if value_type is None:
-            value_type = guess_set_type(setter)
+        '''
+        Guesses a value type from the getter return type hint, or else from the setter
+        value argument type hint.
+
+        Guesses are cached per function. Bound methods are looked up by their underlying
+        function, so that the cache does not keep their instance alive.
+        Unhashable callables are guessed without caching.
+        '''
+        value_type = None
+        if getter is not None:
+            value_type = _guess_type(_guess_get_type_cached, _guess_get_type, getter)
+        if (value_type is None) and (setter is not None):
+            value_type = _guess_type(_guess_set_type_cached, _guess_set_type, setter)
 
         return value_type
 
     def __copy__(self) -> GetterSetterProperty[VT]:
-        new = type(self)(self._get, self._set, self.value_type)
+        new = type(self)(
+            self._value_get if self.can_read else None,
+            self._value_set if self.can_write else None,
+            self.value_type,
+        )
         self.__copy_super__(new)
         return new
 
@@ -234,12 +278,12 @@ class GetterSetterProperty(Property[VT]):
 
     @property
     def can_read(self) -> bool:
-        return self._get is not None
+        return self._value_get is not _not_readable
     can_read.__doc__ = Property.can_read.__doc__
 
     @property
     def can_write(self) -> bool:
-        return self._set is not None
+        return self._value_set is not _not_writable
     can_write.__doc__ = Property.can_write.__doc__
 
 
@@ -267,6 +311,16 @@ class SettableDescriptorProtocol(Protocol[T_contra, SV_contra]):
 Descriptor: 'TypeAlias' = Union[GettableDescriptorProtocol, SettableDescriptorProtocol]
 
 
+def _is_descriptor(obj: Any) -> bool:
+    '''
+    Tells if an object implements GettableDescriptorProtocol or SettableDescriptorProtocol.
+
+    Same outcome than an isinstance() check against these runtime protocols,
+    without the cost of the protocol machinery.
+    '''
+    return hasattr(obj, '__get__') or hasattr(obj, '__set__')
+
+
 class _ClassWithSlot:
 
     __slots__ = ('a_slot',)
@@ -284,6 +338,8 @@ _filter_types = (
 
 class DescriptorProperty(GetterSetterProperty[VT]):
 
+    __slots__ = ('__instance', '__descriptor')
+
     def __init__(
         self, instance: Any,
         descriptor: Union[Descriptor, str],
@@ -297,7 +353,7 @@ class DescriptorProperty(GetterSetterProperty[VT]):
             except KeyError:
                 raise ValueError(f'Unknown attribute {descriptor_name}')
 
-        if not isinstance(descriptor, (GettableDescriptorProtocol, SettableDescriptorProtocol)):
+        if not _is_descriptor(descriptor):
             if descriptor_name is None:
                 raise TypeError(
                     'Provided descriptor is not a valid one (missing __get__ or __set__)')
@@ -351,7 +407,7 @@ class DescriptorProperty(GetterSetterProperty[VT]):
         for name, attr in vars(type(instance)).items():
             if isinstance(attr, _filter_types):
                 continue
-            if not isinstance(attr, (GettableDescriptorProtocol, SettableDescriptorProtocol)):
+            if not _is_descriptor(attr):
                 continue
 
             value_type = types.get(name, None)
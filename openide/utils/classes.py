@@ -55,18 +55,24 @@ def MetaClassResolver(*subclasses, extra_metas=None):
     Can also be used to quickly declare several metaclasses:
     class MyClass(MetaClassResolver(extra_metas=[ABCMeta, SingletonMeta])):
         ...
+
+    Resolvers are cached: calling it again with the same subclasses and extra metaclasses
+    returns the same resolver class.
     '''
+    if extra_metas is None:
+        extra_metas = ()
+    return _make_resolver(subclasses, tuple(extra_metas))
+
+
+@lru_cache(maxsize=None)
+def _make_resolver(subclasses, extra_metas):
     # Main principle of a metaclass resolver is to generate a dynamic metaclass
     # subclassing all metaclasses of the subclasses we are interested to have.
     #
     # class _ResolverMeta(metaclass1, metaclass2, ...): ...
     # class _Resolver(subclass1, subclass2, ..., metaclass=_ResolverMeta): ...
 
-    if extra_metas is None:
-        extra_metas = []
-    extra_metas = list(extra_metas)
-
-    all_metas = [type(subclass) for subclass in subclasses] + extra_metas
+    all_metas = [type(subclass) for subclass in subclasses] + list(extra_metas)
     all_metas = list(dict.fromkeys(all_metas))  # Uniquify, keeping order
 
     # Ensure type is last
@@ -178,8 +184,8 @@ def MetaClassResolver(*subclasses, extra_metas=None):
 
 
 def dig_wrapped(cls):
-    while hasattr(cls, '__wrapped__'):
-        cls = cls.__wrapped__
+    while (wrapped := getattr(cls, '__wrapped__', None)) is not None and wrapped is not cls:
+        cls = wrapped
     return cls
 
 
@@ -7,8 +7,10 @@
 from __future__ import annotations
 
 # System imports
+import gc
 from copy import copy, deepcopy
-from typing import Mapping, Optional, Protocol, Type
+from typing import Any, Mapping, Optional, Protocol, Type
+from weakref import ref
 
 # Third-party imports
 import pytest
@@ -392,3 +394,93 @@ def test_bad_properties(attribute: str, expected_exception: Type[Exception]) ->
 
     with pytest.raises(expected_exception):
         DescriptorProperty(plenty_bad, attribute)
+
+
+def test_all_properties_several_instances() -> None:
+    rw1 = RWProperty()
+    rw2 = RWProperty()
+
+    properties1 = dict(DescriptorProperty.all_properties(rw1))
+    properties2 = dict(DescriptorProperty.all_properties(rw2))
+    assert properties1.keys() == properties2.keys() == {'attr'}
+
+    properties1['attr'].value = 12
+    properties2['attr'].value = 34
+    assert rw1.attr == 12
+    assert rw2.attr == 34
+
+
+class NotADescriptor:
+    ...
+
+
+class ConstantDescriptor:
+    # Instances take the same size as NotADescriptor ones
+
+    def __get__(self, obj: Optional[Any], objtype: Optional[Type] = None) -> str:
+        return 'hello'
+
+
+def test_all_properties_class_changed() -> None:
+    class Changing:
+        @property
+        def attr(self) -> int:
+            return 12
+
+    # Set afterwards, so that it stays last in the class attributes when set again below
+    Changing.other_attr = NotADescriptor()  # type: ignore
+    changing = Changing()
+    assert list(dict(DescriptorProperty.all_properties(changing))) == ['attr']
+
+    # Replaced by a descriptor, likely to reuse the memory (and id) of the previous attribute
+    del Changing.other_attr
+    Changing.other_attr = ConstantDescriptor()  # type: ignore
+    properties = dict(DescriptorProperty.all_properties(changing))
+    assert list(properties) == ['attr', 'other_attr']
+    assert properties['other_attr'].value == 'hello'
+
+    Changing.attr = property(lambda self: 34)  # type: ignore
+    properties = dict(DescriptorProperty.all_properties(changing, dict(other_attr=str, attr=int)))
+    assert properties['attr'].value == 34
+
+    del Changing.attr
+    assert list(dict(DescriptorProperty.all_properties(changing, dict(other_attr=str)))) == [
+        'other_attr']
+
+
+class OwnerDescriptor:
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.owner = owner
+
+    def __get__(self, obj: Optional[Any], objtype: Optional[Type] = None) -> int:
+        return 12
+
+
+def test_all_properties_class_collected() -> None:
+    cls = type('Dynamic', (), dict(attr=OwnerDescriptor()))
+    properties = dict(DescriptorProperty.all_properties(cls()))
+    assert properties['attr'].value == 12
+
+    cls_ref = ref(cls)
+    del cls, properties
+    gc.collect()
+    assert cls_ref() is None
+
+
+class UnresolvableHint:
+
+    @property
+    def attr(self) -> 'Undefined':  # type: ignore # noqa: F821
+        return 12
+
+
+def test_all_properties_given_type_unresolvable_hint() -> None:
+    unresolvable = UnresolvableHint()
+
+    with pytest.raises(NameError):
+        dict(DescriptorProperty.all_properties(unresolvable))
+
+    properties = dict(DescriptorProperty.all_properties(unresolvable, dict(attr=int)))
+    assert properties['attr'].value_type is int
+    assert properties['attr'].value == 12
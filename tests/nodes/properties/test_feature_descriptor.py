@@ -277,6 +277,81 @@ def test_values(values: ValuesType) -> None:
     check_attributes(sut, make_attrs(values=values))
 
 
+def test_values_not_shared() -> None:
+    sut1 = FeatureDescriptor()
+    sut2 = FeatureDescriptor()
+
+    sut1.set_value('test', True)
+    assert sut1.attribute_names == frozenset(['test'])
+    assert sut2.attribute_names == frozenset()
+    assert sut2.get_value('test') is None
+    assert FeatureDescriptor().attribute_names == frozenset()
+
+
+def test_attribute_names_follow_values() -> None:
+    sut = FeatureDescriptor()
+    assert sut.attribute_names == frozenset()
+
+    sut.set_value('first', 1)
+    assert sut.attribute_names == frozenset(['first'])
+    sut.set_value('first', 2)
+    sut.set_value('second', 3)
+    assert sut.attribute_names == frozenset(['first', 'second'])
+
+    other = FeatureDescriptor()
+    other.set_value('third', 4)
+    assert other.attribute_names == frozenset(['third'])
+    merged = FeatureDescriptor.merge(sut, other)
+    assert merged.attribute_names == frozenset(['first', 'second', 'third'])
+
+
+def test_hash() -> None:
+    sut = FeatureDescriptor()
+    assert hash(sut) == hash(None)
+
+    sut.system_name = 'sys'
+    assert hash(sut) == hash('sys')
+    assert hash(copy(sut)) == hash('sys')
+
+    sut.system_name = 'another sys'
+    assert hash(sut) == hash('another sys')
+
+
+class ComputedNames(FeatureDescriptor):
+
+    @property
+    def system_name(self) -> Optional[str]:
+        return 'computed_sys'
+
+    @system_name.setter
+    def system_name(self, value: Optional[str]) -> None:
+        ...
+
+    @property
+    def display_name(self) -> Optional[str]:
+        return 'computed'
+
+    @display_name.setter
+    def display_name(self, value: Optional[str]) -> None:
+        ...
+
+
+def test_overridden_name_eq_hash() -> None:
+    sut = ComputedNames()
+    other = FeatureDescriptor()
+    other.system_name = 'computed_sys'
+
+    assert sut == other
+    assert hash(sut) == hash(other)
+    assert len({sut, other}) == 1
+
+
+def test_overridden_name_fallbacks() -> None:
+    sut = ComputedNames()
+    assert sut.short_description == 'computed'
+    assert FeatureDescriptor.display_name.fget(sut) == 'computed_sys'  # type: ignore
+
+
 COPY_PARAMETERS = [
     ({}, None, None),
     (dict(system_name='sys'), 'another sys', None),
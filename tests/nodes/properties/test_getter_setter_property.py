@@ -8,6 +8,7 @@ from __future__ import annotations
 
 # System imports
 from copy import copy
+from dataclasses import dataclass
 
 # Third-party imports
 import pytest
@@ -163,3 +164,47 @@ def test_no_type_hint() -> None:
     ro.set_attr(41)
     check(prop, 41)
     check(cloned_prop, 41)
+
+
+@dataclass
+class UnhashableSetter:
+    # Being a non-frozen dataclass with eq, instances are unhashable
+    value: int = 0
+
+    def __call__(self, value: int) -> None:
+        self.value = value
+
+
+def test_unhashable_setter() -> None:
+    setter = UnhashableSetter()
+
+    prop = GetterSetterProperty(setter=setter)
+    assert prop.value_type is int
+    assert prop.can_read is False
+    assert prop.can_write is True
+
+    prop.value = 12
+    assert setter.value == 12
+
+
+def test_eq_hash() -> None:
+    rw = RWMethods()
+
+    prop = GetterSetterProperty(rw.get_attr, rw.set_attr)
+    prop.system_name = 'attr'
+
+    same_prop = GetterSetterProperty(rw.get_attr, value_type=int)
+    same_prop.system_name = 'attr'
+    assert prop == same_prop
+    assert hash(prop) == hash(same_prop)
+    assert hash(copy(prop)) == hash(prop)
+
+    other_type_prop = GetterSetterProperty(rw.get_attr, value_type=float)
+    other_type_prop.system_name = 'attr'
+    assert prop != other_type_prop
+
+    prop.system_name = 'other_attr'
+    assert prop != same_prop
+    same_prop.system_name = 'other_attr'
+    assert prop == same_prop
+    assert hash(prop) == hash(same_prop)
@@ -211,3 +211,24 @@ def test_subclasses_subclass(subclasses: Iterable[Type]) -> None:
             return True
 
     check(SubclassToTest, subclasses, check_method3=True)
+
+
+def test_resolver_cached() -> None:
+    assert MetaClassResolver(Normal1, AWidget) is MetaClassResolver(Normal1, AWidget)
+    assert (
+        MetaClassResolver(Normal1, extra_metas=[ABCMeta])
+        is MetaClassResolver(Normal1, extra_metas=(ABCMeta, ))
+    )
+    assert MetaClassResolver(Normal1, AWidget) is not MetaClassResolver(AWidget, Normal1)
+
+    # Classes built from the same resolver share its metaclass, and so can be combined
+    class ToTest1(MetaClassResolver(Normal1, AWidget)):  # type: ignore[misc]
+        ...
+
+    class ToTest2(MetaClassResolver(Normal1, AWidget)):  # type: ignore[misc]
+        ...
+
+    class Combined(ToTest1, ToTest2):
+        ...
+
+    assert isinstance(Combined(), AWidget)